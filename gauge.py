@@ -1,7 +1,264 @@
+import functools
+import math
+import queue
+import sys
+import threading
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
 
 import numpy as np
-from PIL import Image, ImageDraw, ImageTk
+from PIL import Image, ImageDraw, ImageFont, ImageTk
+
+
+def load_font(font, size):
+    # PIL wants a font file, tk wants a family name. try both, fall back to default
+    if font is not None:
+        try:
+            return ImageFont.truetype(font, size)
+        except OSError:
+            pass
+    return ImageFont.load_default(size)
+
+
+def event_image_xy(e, label, image):
+    # coords of event inside image shown on label. tk centers the image in the label, and the
+    # event may come from a widget placed on top of it, so go through root coords
+    x = e.x_root - label.winfo_rootx() - (label.winfo_width() - image.width()) // 2
+    y = e.y_root - label.winfo_rooty() - (label.winfo_height() - image.height()) // 2
+    return x, y
+
+
+class GlyphAtlas:
+    """Rendered glyph masks for one (font, size) pair, shared by all gauges.
+
+    Strings are composed by pasting cached glyph masks instead of asking PIL to
+    resolve the font and lay out the text on every call.
+    """
+
+    _atlases = {}
+    _atlases_lock = threading.Lock()
+
+    def __init__(self, font, size):
+        self._lock = threading.Lock()  # gauges may render on RenderPool threads
+        self.font = load_font(font, size)
+        ascent, descent = self.font.getmetrics()
+        self.height = ascent + descent
+        self._pad = size // 4 + 1  # room for glyphs that overhang their advance (italics etc)
+        self._glyphs = {}
+        self.render = functools.lru_cache(maxsize=256)(self._render)
+
+    @classmethod
+    def get(cls, font, size):
+        key = (font, size)
+        atlas = cls._atlases.get(key)
+        if atlas is None:
+            with cls._atlases_lock:
+                atlas = cls._atlases.get(key)
+                if atlas is None:
+                    atlas = cls._atlases[key] = cls(font, size)
+        return atlas
+
+    def glyph(self, char):
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            with self._lock:
+                advance = self.font.getlength(char)
+                mask = Image.new("L", (math.ceil(advance) + 2 * self._pad, self.height))
+                ImageDraw.Draw(mask).text((self._pad, 0), char, font=self.font, fill=255)
+                glyph = self._glyphs[char] = (mask, advance)
+        return glyph
+
+    def _render(self, text, fill, anchor):
+        # returns RGBA layer of the text and offset of its top left corner from the anchor point.
+        # layer is shared, don't draw on it
+        with self._lock:
+            width = self.font.getlength(text)
+        mask = Image.new("L", (math.ceil(width) + 2 * self._pad, self.height))
+        x = 0
+        for char in text:
+            glyph, advance = self.glyph(char)
+            mask.paste(255, (round(x), 0), glyph)
+            x += advance
+        layer = Image.new("RGBA", mask.size, fill)
+        layer.putalpha(mask)
+        # let PIL work out where the anchor is, once per string
+        with self._lock:
+            left, top = self.font.getbbox(text, anchor="la")[:2]
+            a_left, a_top = self.font.getbbox(text, anchor=anchor)[:2]
+        return layer, a_left - left - self._pad, a_top - top
+
+    def draw(self, im, xy, text, fill, anchor="la"):
+        # same as ImageDraw.text(xy, text, fill, anchor=anchor) with this font
+        layer, dx, dy = self.render(text, fill, anchor)
+        x, y = round(xy[0] + dx), round(xy[1] + dy)
+        if x + layer.width <= 0 or y + layer.height <= 0:
+            return
+        # alpha_composite does not take negative dest, so crop the layer instead
+        im.alpha_composite(layer, (max(x, 0), max(y, 0)), (max(-x, 0), max(-y, 0)))
+
+
+class RenderPool:
+    """Renders gauge images on worker threads, only the PhotoImage is made on the Tk thread.
+
+    Pass the same pool to many gauges with render_pool=. Each gauge has at most one
+    image being rendered; values written meanwhile just replace its pending value,
+    so superseded values are never rendered. Finished images are handed back through
+    a queue that the Tk thread polls, and only the newest image of a gauge is shown.
+    Gauge gets show(image, *args) with the same args its render(*args) got.
+    """
+
+    poll_ms = 5
+
+    def __init__(self, master, workers=None):
+        self.master = master
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gauge-render")
+        self._done = queue.SimpleQueue()  # only thing touched from both sides
+        # these are Tk thread only
+        self._pending = {}  # gauge -> args of latest render request
+        self._busy = set()  # gauges with a render on a worker
+        self._poll_job = None
+
+    def submit(self, gauge, *args):
+        self._pending[gauge] = args
+        if gauge not in self._busy:
+            self._start(gauge)
+
+    def has_pending(self, gauge):
+        # whether gauge has a request waiting, which the next submit replaces before it is rendered
+        return gauge in self._pending
+
+    def _start(self, gauge):
+        args = self._pending.pop(gauge)
+        self._busy.add(gauge)
+        self._executor.submit(self._work, gauge, args)
+        if self._poll_job is None:
+            self._poll_job = self.master.after(self.poll_ms, self.poll)
+
+    def _work(self, gauge, args):
+        try:
+            self._done.put((gauge, gauge.render(*args), args, None))
+        except Exception as e:
+            self._done.put((gauge, None, args, e))
+
+    def poll(self):
+        self._poll_job = None
+        frames = {}  # newest image per gauge, older ones are stale
+        error = None
+        while True:
+            try:
+                gauge, im, args, e = self._done.get_nowait()
+            except queue.Empty:
+                break
+            self._busy.discard(gauge)
+            frames[gauge] = (im, args)
+            error = error or e
+        for gauge, (im, args) in frames.items():
+            if gauge in self._pending:
+                self._start(gauge)
+            if im is not None and gauge.winfo_exists():
+                gauge.show(im, *args)
+        if self._busy and self._poll_job is None:
+            self._poll_job = self.master.after(self.poll_ms, self.poll)
+        if error is not None:
+            raise error
+
+    def shutdown(self):
+        if self._poll_job is not None:
+            self.master.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ValueHistory:
+    """Last values of a gauge for the history overlay, kept incrementally in preallocated arrays.
+
+    Values are kept as their bin in a ring buffer. Appending is O(1) and allocates nothing:
+    it updates how many kept values fall in each bin (so the min/max envelope only moves
+    when an edge bin empties) and when each bin was last hit (so the trail needs no decay
+    pass). The overlay is then a lookup of every pixel's bin in one small per-bin alpha table,
+    filled into one of two preallocated tables so a render on a worker can read the other.
+    """
+
+    bins = 256
+    envelope_alpha = 50
+    trail_alpha = 140
+
+    def __init__(self, length, minvalue, maxvalue):
+        self.length = length
+        self.minvalue = minvalue
+        self.maxvalue = maxvalue
+        self.ring = np.zeros(length, dtype=np.intp)  # bins of kept values
+        self.counts = np.zeros(self.bins, dtype=np.intp)  # number of kept values per bin
+        self.last_seen = np.zeros(self.bins, dtype=np.int64)  # sample number of newest value per bin
+        # trail alpha by age in samples, faded out after length samples
+        decay = (1 / 255) ** (1 / length)
+        self.fade = np.zeros(length + 1, dtype=np.uint8)
+        self.fade[:-1] = np.rint(self.trail_alpha * decay ** np.arange(length))
+        # scratch for lut, last bin of alpha table is for pixels off the scale
+        self._luts = [np.zeros(self.bins + 1, dtype=np.uint8) for _ in range(2)]
+        self._age = np.zeros(self.bins, dtype=np.int64)
+        self._trail = np.zeros(self.bins, dtype=np.uint8)
+        self.clear()
+
+    def clear(self):
+        self.samples = 0  # appended since clear
+        self.counts[:] = 0
+        self.last_seen[:] = -self.length
+        self.low = self.high = 0  # envelope, first and last bin with kept values
+
+    def bin(self, value):
+        n_bin = round((value - self.minvalue) / (self.maxvalue - self.minvalue) * (self.bins - 1))
+        return min(max(n_bin, 0), self.bins - 1)
+
+    def append(self, value):
+        if not math.isfinite(value):  # nan has no bin, a gap in data is not a value
+            return
+        n_bin = self.bin(value)
+        pos = self.samples % self.length
+        old = self.ring[pos] if self.samples >= self.length else None
+        # add new one
+        self.ring[pos] = n_bin
+        self.counts[n_bin] += 1
+        self.last_seen[n_bin] = self.samples
+        if self.samples == 0:
+            self.low = self.high = n_bin
+        else:
+            self.low = min(self.low, n_bin)
+            self.high = max(self.high, n_bin)
+        self.samples += 1
+        # drop the one that fell out, envelope only shrinks when its edge bin empties
+        if old is not None:
+            self.counts[old] -= 1
+            while self.counts[self.low] == 0:
+                self.low += 1
+            while self.counts[self.high] == 0:
+                self.high -= 1
+
+    def lut(self, wedge_from, wedge_to, swap=False):
+        # alpha per bin: envelope under fading trail, nothing where the wedge is.
+        # swap to fill the other table, when the one handed out last may still be read by a render
+        if swap:
+            self._luts.reverse()
+        lut = self._luts[0]
+        lut[:] = 0
+        if self.samples:
+            lut[self.low : self.high + 1] = self.envelope_alpha
+            np.subtract(self.samples - 1, self.last_seen, out=self._age)
+            np.minimum(self._age, self.length, out=self._age)
+            np.take(self.fade, self._age, out=self._trail)
+            np.maximum(lut[:-1], self._trail, out=lut[:-1])
+            if math.isfinite(wedge_from) and math.isfinite(wedge_to):
+                lut[self.bin(wedge_from) : self.bin(wedge_to) + 1] = 0
+        return lut
+
+    def bin_map(self, value_map, mask):
+        # bin of every pixel, pixels outside of mask get the empty last bin
+        bins = np.rint((value_map - self.minvalue) / (self.maxvalue - self.minvalue) * (self.bins - 1))
+        bins = np.clip(bins, 0, self.bins - 1).astype(np.uint16)
+        bins[~mask] = self.bins
+        return bins
 
 
 class RollMeter(tk.Frame):
@@ -11,6 +268,15 @@ class RollMeter(tk.Frame):
     cut_bottom = 0.65  # 1 to not cut, 0.4 to cut 60% etc
     base_size = 250
     base_font_size = 16
+    frame_ms = 16  # interactive mode applies at most one value per this many ms
+    hit_tolerance = 5  # pixels around arc that still grab it in interactive mode
+    resize_ms = 150  # in resizable mode, rebuild after size didn't change for this long
+    resize_bucket = 10  # in resizable mode, box_length is rounded down to multiple of this
+    resize_cache_size = 8  # number of sizes to keep built layers for
+    # attributes that depend on size, swapped in and out of layer cache
+    _layout_attrs = ("box_length", "box_length_ss", "arc_width", "fontsize", "fontsize_ticks", "_offset", "base",
+                     "_tick_values", "_value_map", "_hit_map", "_arc_map", "_bin_map", "_alpha",
+                     "_alpha_image", "_overlay")
 
     def __init__(
         self,
@@ -30,11 +296,18 @@ class RollMeter(tk.Frame):
         scale_color=None,
         wedge_color=None,
         ss_mult=None,
+        text_in_image=None,
+        interactive=None,
+        snap_to_ticks=None,
+        render_pool=None,
+        resizable=None,
+        history=None,
         **kwargs,
     ):
         # params
         self.ss_mult = ss_mult or 2 # supersampling for antialiasing
         self.showtext = showtext or True # show label in the middle
+        self.text_in_image = text_in_image or False # draw label into the gauge image instead of a tk.Label
         self.var = variable or tk.DoubleVar(value=minvalue) # create var or use supplied
         self._user_supplied_var = False if textvariable is None else True  # flag that user supplied textvar
         self.textvar = textvariable or tk.StringVar()  # if user hasn't supplied it, display var
@@ -43,15 +316,20 @@ class RollMeter(tk.Frame):
         self.arc_width = arc_width or 10 # width of gauge arc in pixels
         self.minvalue = minvalue or 0 
         self.maxvalue = maxvalue or 100
-        self.box_length = box_length or self.base_size # size of squart box in which to put arc
-        self.box_length_ss = round(self.box_length * self.ss_mult)
         self.scale_color = scale_color or "#e5e5e5"
         self.wedge_color = scale_color or "#343a40"
         self.font = font or "Courier"
-        self.fontsize = round(self.base_font_size * (self.box_length / self.base_size)) # for main label in the middle
-        self.fontsize_ticks = max(round(self.base_font_size * (self.box_length / self.base_size) / 2), 14)
         self.major_ticks_step = major_ticks_step or 5
         self.minor_ticks_per_major = minor_ticks_per_major or 5
+        self.interactive = interactive or False  # drag the wedge with mouse
+        self.snap_to_ticks = snap_to_ticks or False  # in interactive mode, snap value to nearest tick
+        self.render_pool = render_pool  # RenderPool to render on, None to render on Tk thread
+        self.resizable = resizable or False  # follow size of frame given by geometry manager
+        # number of last values to show as min/max envelope and fading trail, None to not show
+        self.history = ValueHistory(history, self.minvalue, self.maxvalue) if history else None
+        self._init_box_length = box_length or self.base_size
+        self._init_arc_width = self.arc_width
+        self.set_size(self._init_box_length)
 
         # asserts
         assert 0 < self.wedgesize < 100
@@ -62,6 +340,58 @@ class RollMeter(tk.Frame):
         kwargs["height"] = self.box_length * self.cut_bottom
         super().__init__(master=master, **kwargs)
 
+        # position of label in the middle, relative to height
+        try:
+            rely = 0.25 / (1 - self.cut_bottom)
+        except ZeroDivisionError:
+            rely = 1
+        self._text_rely = min(rely, 0.9)
+
+        # trace
+        self._last_text = None
+        self.var.trace_add("write", self.var_changed_cb)
+        if self.text_in_image and self._user_supplied_var:
+            self.textvar.trace_add("write", lambda *args: self.draw_wedge())
+
+        # draw
+        self._preview_size = None  # size to stretch image to while being resized
+        self._resize_job = None
+        self.meter = tk.Label(self)
+        self.draw_base()
+        self.draw_ticks()
+        self.build_maps()
+        self._update_layout()
+        self.var_changed_cb()  # force this callback to update textvar and draw wedge
+        self.meter.place(x=0, y=0)
+
+        # label with text
+        if self.showtext and not self.text_in_image:
+            self.text_label = tk.Label(self, textvariable=self.textvar, width=7, font=(self.font, self.fontsize, "italic"))
+            self.text_label.place(relx=0.5, rely=self._text_rely, anchor="center")
+
+        # interactive mode
+        self._dragging = False
+        self._drag_xy = None
+        self._drag_job = None
+        if self.interactive:
+            for widget in (self.meter, getattr(self, "text_label", None)):
+                if widget is not None:
+                    widget.bind("<Button-1>", self.on_press)
+                    widget.bind("<B1-Motion>", self.on_drag)
+                    widget.bind("<ButtonRelease-1>", self.on_release)
+
+        # resizable mode
+        if self.resizable:
+            self._layers = OrderedDict()  # size bucket -> _layout_attrs
+            self._layers[self.box_length] = self._get_layout()
+            self.bind("<Configure>", self.on_configure)
+
+    def set_size(self, box_length):
+        self.box_length = box_length # size of squart box in which to put arc
+        self.box_length_ss = round(self.box_length * self.ss_mult)
+        self.arc_width = max(round(self._init_arc_width * box_length / self._init_box_length), 1)
+        self.fontsize = round(self.base_font_size * (self.box_length / self.base_size)) # for main label in the middle
+        self.fontsize_ticks = max(round(self.base_font_size * (self.box_length / self.base_size) / 2), 14)
         # automagically get offset
         self._offset = (
             max(
@@ -74,31 +404,65 @@ class RollMeter(tk.Frame):
             * self.ss_mult
         )
 
-        # trace
-        self.var.trace_add("write", self.var_changed_cb)
+    def min_size(self):
+        # smallest box_length the layout works at, below it tick label offset leaves no room for arc.
+        # small gauges have fontsize_ticks at its floor of 14, and arc_width scales with box_length
+        n_chars = max(len(f"{self.maxvalue:.1f}{self.textappend}"), len(f"{self.minvalue:.1f}{self.textappend}"))
+        arc_ratio = min(self._init_arc_width / self._init_box_length, 0.4)
+        box_length = (n_chars * 14 * 0.5 + 1) / (0.5 - arc_ratio)
+        return math.ceil(box_length / self.resize_bucket) * self.resize_bucket
 
-        # draw
-        self.meter = tk.Label(self)
-        self.draw_base()
-        self.draw_ticks()
-        self.draw_wedge()
-        self.meter.place(x=0, y=0)
+    def _get_layout(self):
+        return {attr: getattr(self, attr) for attr in self._layout_attrs if hasattr(self, attr)}
 
-        # label with text
-        if self.showtext:
-            self.text_label = tk.Label(self, textvariable=self.textvar, width=7, font=(self.font, self.fontsize, "italic"))
-            try:
-                rely = 0.25 / (1 - self.cut_bottom)
-            except ZeroDivisionError:
-                rely = 1
-            rely = min(rely, 0.9)
-            self.var_changed_cb()  # force this callback to update textvar
-            self.text_label.place(relx=0.5, rely=rely, anchor="center")
+    def _update_layout(self):
+        # snapshot handed to render, which may run on a worker while a resize swaps attributes
+        generation = self._layout["generation"] + 1 if hasattr(self, "_layout") else 0
+        self._layout = dict(self._get_layout(), generation=generation)
+
+    def on_configure(self, e):
+        box_length = min(e.width, e.height / self.cut_bottom)
+        box_length = max(int(box_length // self.resize_bucket) * self.resize_bucket, self.min_size())
+        current = self._preview_size[0] if self._preview_size is not None else self.box_length
+        if box_length == current:
+            return
+        # while user drags, just stretch last image, rebuild once size settles
+        self._preview_size = (box_length, round(box_length * self.cut_bottom))
+        self.show(self._last_image)
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(self.resize_ms, self.apply_resize, box_length)
+
+    def apply_resize(self, box_length):
+        self._resize_job = None
+        self._preview_size = None
+        layout = self._layers.pop(box_length, None)
+        if layout is None:
+            self.set_size(box_length)
+            self.draw_base()
+            self.draw_ticks()
+            self.build_maps()
+            layout = self._get_layout()
+        else:
+            for attr, value in layout.items():
+                setattr(self, attr, value)
+        self._layers[box_length] = layout  # most recently used goes last
+        while len(self._layers) > self.resize_cache_size:
+            self._layers.popitem(last=False)
+        self._update_layout()
+        if hasattr(self, "text_label"):
+            self.text_label.configure(font=(self.font, self.fontsize, "italic"))
+        self.draw_wedge()
 
     def var_changed_cb(self, *args):
+        if self.history is not None:
+            self.history.append(self.value)
         if self.showtext:
             if not self._user_supplied_var:
-                self.text = f"{self.value:.1f}{self.textappend}"
+                text = f"{self.value:.1f}{self.textappend}"
+                if text != self._last_text:  # setting textvar makes tk relayout the label, skip if same
+                    self._last_text = text
+                    self.text = text
         self.draw_wedge()
 
     @property
@@ -153,6 +517,7 @@ class RollMeter(tk.Frame):
         tick_outer_r_ss = round(arc_r_ss - (arc_w_ss - l_tick_ss) / 2) 
         tick_inner_r_ss = round(tick_outer_r_ss - l_tick_ss)
         fontsize_ticks_ss = round(self.fontsize_ticks * self.ss_mult)
+        atlas = GlyphAtlas.get(None, fontsize_ticks_ss)
         arc_r_ss = lb_ss * 0.5 - offset_ss # radius of arc
         l_arc_r_ss = arc_r_ss + round(offset_ss/2) # radius of arc where to make labels
         # major ticks
@@ -176,7 +541,7 @@ class RollMeter(tk.Frame):
             n_pos_rad = -n_pos_rad  # because numpy counts counterclockwise, and pillow counts clockwise
             x = lb_ss * 0.5 + l_arc_r_ss * np.sin(n_pos_rad) # these are coords of the CENTER of label
             y = lb_ss * 0.5 + l_arc_r_ss * np.cos(n_pos_rad) # look how I draw with anchor='mm'
-            draw.text((x, y), text, anchor="mm", font_size=fontsize_ticks_ss, fill=self.wedge_color)
+            atlas.draw(self.base, (x, y), text, self.wedge_color, anchor="mm")
         # minor ticks
         l_tick_ss = l_tick_ss * 0.5
         tick_outer_r_ss = round(arc_r_ss - (arc_w_ss - l_tick_ss) / 2) 
@@ -190,6 +555,7 @@ class RollMeter(tk.Frame):
                 end = end - (max_v - end) / min_ts
                 break  # WARN: crutch
             pos_min.extend(np.arange(start, end, min_ts))
+        self._tick_values = np.clip(np.sort(np.concatenate((pos_maj, pos_min))), min_v, max_v) # to snap to
         for pos in pos_min:
             n_pos = np.interp(pos, (min_v, max_v), (s_deg, e_deg)) # normalized deg pos on arc
             n_pos -= 180 # because pillow counts weirdly from +90 deg. also WTF
@@ -202,17 +568,45 @@ class RollMeter(tk.Frame):
             draw.line((x1,y1,x2,y2), width=w_tick_ss, fill=self.wedge_color)
 
     def draw_wedge(self):
-        im = self.base.copy()
+        # tk variables can only be read on this thread, render itself can go to a worker.
+        # first image is rendered here so widget has its size right away
+        val = self.value
+        lut = None
+        if self.history is not None:  # history changes on this thread, so take it here
+            ws_val = self.wedgesize * (self.maxvalue - self.minvalue) / (self.end_deg - self.start_deg) # wedge size in value
+            # table of a waiting request is free to refill, it gets replaced anyway. otherwise
+            # use the other table, last one may still be read by a render on a worker
+            swap = self.render_pool is not None and not self.render_pool.has_pending(self)
+            lut = self.history.lut(val - ws_val, val + ws_val, swap=swap)
+        if self.render_pool is not None and hasattr(self, "meterimage"):
+            self.render_pool.submit(self, val, self.text, self._layout, lut)
+        else:
+            self.show(self.render(val, self.text, self._layout, lut))
+
+    def show(self, im, val=None, text=None, layout=None, lut=None):
+        # frames rendered for a size we since resized from are dropped
+        if layout is not None and layout["generation"] != self._layout["generation"]:
+            return
+        self._last_image = im
+        if self._preview_size is not None:  # being resized, stretch until it settles
+            im = im.resize(self._preview_size, Image.BILINEAR)
+        self.meterimage = ImageTk.PhotoImage(im)
+        # put image on label
+        self.meter.configure(image=self.meterimage)
+
+    def render(self, val, text, layout, lut=None):
+        # PIL only, safe to run off the Tk thread. size dependent attributes come from layout
+        # snapshot only, they may be swapped by a resize meanwhile. lut is history overlay alpha per bin
+        im = layout["base"].copy()
         draw = ImageDraw.Draw(im)
         # get normalized value from self.start_deg to self.end_deg degrees
-        val = self.value
         normalized_val = np.interp(val, (self.minvalue, self.maxvalue), (self.start_deg, self.end_deg))
         ws = self.wedgesize
         # draw wedge
-        len_im = self.box_length # length of end image after reducing
-        lb_ss = self.box_length_ss
-        offset_ss = self._offset
-        arc_w = round(self.arc_width * self.ss_mult)
+        len_im = layout["box_length"] # length of end image after reducing
+        lb_ss = layout["box_length_ss"]
+        offset_ss = layout["_offset"]
+        arc_w = round(layout["arc_width"] * self.ss_mult)
         draw.arc(
             (offset_ss, offset_ss, lb_ss - offset_ss, lb_ss - offset_ss),
             normalized_val - ws,
@@ -224,15 +618,90 @@ class RollMeter(tk.Frame):
         if self.ss_mult != 1:
             im = im.resize((len_im, len_im), Image.BICUBIC)
         # crop image
-        self.meterimage = ImageTk.PhotoImage( im.crop((0, 0, len_im, len_im * self.cut_bottom)))
-        # put image on label
-        self.meter.configure(image=self.meterimage)
+        im = im.crop((0, 0, len_im, round(len_im * self.cut_bottom)))
+        # history under wedge
+        if lut is not None:
+            np.take(lut, layout["_bin_map"], out=layout["_alpha"], mode="clip")
+            overlay = layout["_overlay"]
+            overlay.putalpha(layout["_alpha_image"])  # shares memory with _alpha
+            im.alpha_composite(overlay)
+        # label in the middle
+        if self.showtext and self.text_in_image:
+            atlas = GlyphAtlas.get(self.font, layout["fontsize"])
+            xy = (len_im / 2, im.height * self._text_rely)
+            atlas.draw(im, xy, text, self.wedge_color, anchor="mm")
+        return im
+
+    def build_maps(self):
+        # per-pixel geometry for interactive mode and history overlay
+        if self.interactive or self.history is not None:
+            self.build_hit_map()
+        if self.history is not None:
+            self._bin_map = self.history.bin_map(self._value_map, self._arc_map)
+            self._alpha = np.zeros(self._bin_map.shape, dtype=np.uint8)
+            size = self._alpha.shape[::-1]
+            self._alpha_image = Image.frombuffer("L", size, self._alpha, "raw", "L", 0, 1)
+            self._overlay = Image.new("RGBA", size, self.wedge_color)
+
+    def build_hit_map(self):
+        # value under every pixel of output image, and whether pixel is on the arc. done once,
+        # so mouse events are just a lookup
+        len_im = self.box_length
+        center = len_im / 2
+        arc_w = self.arc_width
+        arc_r = (self.box_length_ss / 2 - self._offset) / self.ss_mult - arc_w / 2 # middle of arc
+        y, x = np.mgrid[: round(len_im * self.cut_bottom), :len_im] + 0.5 - center
+        span = self.end_deg - self.start_deg
+        angle = (np.degrees(np.arctan2(y, x)) - self.start_deg) % 360 # pillow degrees from start of arc
+        on_span = angle <= span
+        # past the end of arc snap to whichever end is closer
+        angle = np.where(on_span, angle, np.where(angle - span < 360 - angle, span, 0))
+        self._value_map = np.interp(angle, (0, span), (self.minvalue, self.maxvalue))
+        r_dist = np.abs(np.hypot(x, y) - arc_r)
+        self._hit_map = r_dist <= arc_w / 2 + self.hit_tolerance
+        self._arc_map = on_span & (r_dist <= arc_w / 2)
+
+    def on_press(self, e):
+        x, y = event_image_xy(e, self.meter, self.meterimage)
+        h, w = self._hit_map.shape
+        self._dragging = 0 <= x < w and 0 <= y < h and self._hit_map[y, x]
+        self.on_drag(e)
+
+    def on_drag(self, e):
+        # motion events come way faster than we can draw, so only remember the last one
+        # and apply it once per frame
+        if not self._dragging:
+            return
+        self._drag_xy = event_image_xy(e, self.meter, self.meterimage)
+        if self._drag_job is None:
+            self._drag_job = self.after(self.frame_ms, self.apply_drag)
+
+    def on_release(self, e):
+        self._dragging = False
+
+    def apply_drag(self):
+        self._drag_job = None
+        x, y = self._drag_xy
+        h, w = self._value_map.shape
+        value = self._value_map[min(max(y, 0), h - 1), min(max(x, 0), w - 1)]
+        if self.snap_to_ticks:
+            value = self._tick_values[np.abs(self._tick_values - value).argmin()]
+        self.value = float(value)
 
 
 class PitchMeter(tk.Frame):
 
     base_font_size = 16
     base_height = 250
+    frame_ms = 16  # interactive mode applies at most one value per this many ms
+    hit_tolerance = 5  # pixels around column that still grab it in interactive mode
+    resize_ms = 150  # in resizable mode, rebuild after size didn't change for this long
+    resize_bucket = 10  # in resizable mode, height is rounded down to multiple of this
+    resize_cache_size = 8  # number of sizes to keep built layers for
+    # attributes that depend on size, swapped in and out of layer cache
+    _layout_attrs = ("height", "width", "fontsize", "fontsize_ticks", "_base_v_offset", "_base_h_offset", "_text_w",
+                     "base", "_tick_values", "_value_map", "_hit_cols", "_bin_map", "_alpha",
+                     "_alpha_image", "_overlay")
 
     def __init__(
         self,
@@ -250,6 +719,12 @@ class PitchMeter(tk.Frame):
         wedgesize=None,
         scale_color=None,
         wedge_color=None,
+        text_in_image=None,
+        interactive=None,
+        snap_to_ticks=None,
+        render_pool=None,
+        resizable=None,
+        history=None,
         **kwargs,
     ):
         # params
@@ -259,31 +734,31 @@ class PitchMeter(tk.Frame):
         self.textvar = textvariable or tk.StringVar()  # TODO: update this value
         self.textappend = textappend or ""
         self._user_supplied_var = False if textvariable is None else True
-        self.height = height or self.base_height
-        self.fontsize = round(self.base_font_size * (self.height / self.base_height))
-        self.fontsize_ticks = max(round(self.base_font_size * (self.height / self.base_height) / 2), 14)
         self.scale_color = scale_color or "#e5e5e5"
         self.wedge_color = wedge_color or "#343a40"
         self.font = font or "Courier"
         self.wedgesize = wedgesize or 2  # this is in percent
         self.major_ticks_step = major_ticks_step or 5
         self.minor_ticks_per_major = minor_ticks_per_major or 5
-
-        # get width automagically out of estimated text width
-        max_text_w = max(
+        self.text_in_image = text_in_image or False  # draw label into the meter image instead of a tk.Label
+        self.interactive = interactive or False  # drag the wedge with mouse
+        self.snap_to_ticks = snap_to_ticks or False  # in interactive mode, snap value to nearest tick
+        self.render_pool = render_pool  # RenderPool to render on, None to render on Tk thread
+        self.resizable = resizable or False  # follow height of frame given by geometry manager
+        # number of last values to show as min/max envelope and fading trail, None to not show
+        self.history = ValueHistory(history, self.minvalue, self.maxvalue) if history else None
+        self._user_width = width
+        self._max_text_w = max(
             len(f"{self.maxvalue:+.1f}{self.textappend}"),
             len(f"{self.minvalue:+.1f}{self.textappend}"),
         )
-        self.width = width or round(max_text_w * self.fontsize_ticks * 0.25)
-        
-        # offsets for drawing rectangle
-        v_offs = self.fontsize_ticks + 2 # vertical offset to give space for tick labels
-        self._base_v_offset = v_offs
-        h_offs = round((max_text_w + 1) * self.fontsize_ticks * 0.5)
-        self._base_h_offset = h_offs
+        self.set_size(height or self.base_height)
 
         # trace
+        self._last_text = None
         self.var.trace_add("write", self.var_changed_cb)
+        if self.text_in_image and self._user_supplied_var:
+            self.textvar.trace_add("write", lambda *args: self.draw_wedge())
 
         # asserts
         assert self.maxvalue > self.minvalue
@@ -299,20 +774,109 @@ class PitchMeter(tk.Frame):
         # labels
         self.meter = tk.Label(self)
         self.label = tk.Label(
-            self, textvariable=self.textvar, anchor="center", width=max_text_w + 1, font=(self.font, self.fontsize, "italic")
+            self, textvariable=self.textvar, anchor="center", width=self._max_text_w + 1, font=(self.font, self.fontsize, "italic")
         )
 
         # draw
+        self._preview_size = None  # size to stretch image to while being resized
+        self._resize_job = None
         self.draw_base()
         self.draw_ticks()
-        self.draw_wedge()
+        self.build_maps()
+        self._update_layout()
 
-        # force this callback to update textvar
+        # force this callback to update textvar and draw wedge
         self.var_changed_cb()
 
         # pack all
         self.meter.pack(expand=True, fill="y", side="left")
-        self.label.pack(expand=True, side="left", anchor="w", padx=(5, 0))
+        if not self.text_in_image:
+            self.label.pack(expand=True, side="left", anchor="w", padx=(5, 0))
+
+        # interactive mode
+        self._dragging = False
+        self._drag_xy = None
+        self._drag_job = None
+        if self.interactive:
+            self.meter.bind("<Button-1>", self.on_press)
+            self.meter.bind("<B1-Motion>", self.on_drag)
+            self.meter.bind("<ButtonRelease-1>", self.on_release)
+
+        # resizable mode. frame size comes from geometry manager instead of children
+        if self.resizable:
+            self._layers = OrderedDict()  # size bucket -> _layout_attrs
+            self._layers[self.height] = self._get_layout()
+            self.update_idletasks()
+            self.configure(width=self.winfo_reqwidth(), height=self.winfo_reqheight())
+            self.pack_propagate(False)
+            self.bind("<Configure>", self.on_configure)
+
+    def set_size(self, height):
+        self.height = height
+        self.fontsize = round(self.base_font_size * (self.height / self.base_height))
+        self.fontsize_ticks = max(round(self.base_font_size * (self.height / self.base_height) / 2), 14)
+        # get width automagically out of estimated text width
+        max_text_w = self._max_text_w
+        self.width = self._user_width or round(max_text_w * self.fontsize_ticks * 0.25)
+        # offsets for drawing rectangle
+        v_offs = self.fontsize_ticks + 2 # vertical offset to give space for tick labels
+        self._base_v_offset = v_offs
+        h_offs = round((max_text_w + 1) * self.fontsize_ticks * 0.5)
+        self._base_h_offset = h_offs
+        # space to the right of the column for label drawn into image
+        self._text_w = round((max_text_w + 1) * self.fontsize * 0.6) + 5 if self.text_in_image else 0
+
+    def min_size(self):
+        # smallest height the layout works at, below it there is no room for column between tick
+        # labels at top and bottom. small gauges have fontsize_ticks at its floor of 14
+        height = 2 * (14 + 2) + 10
+        return math.ceil(height / self.resize_bucket) * self.resize_bucket
+
+    def _get_layout(self):
+        return {attr: getattr(self, attr) for attr in self._layout_attrs if hasattr(self, attr)}
+
+    def _update_layout(self):
+        # snapshot handed to render, which may run on a worker while a resize swaps attributes
+        generation = self._layout["generation"] + 1 if hasattr(self, "_layout") else 0
+        self._layout = dict(self._get_layout(), generation=generation)
+
+    def on_configure(self, e):
+        # height left for image after padding of frame and label
+        height = e.height - 2 * int(self["pady"]) - 2 * (int(self.meter["borderwidth"]) + int(self.meter["pady"]))
+        height = max(int(height // self.resize_bucket) * self.resize_bucket, self.min_size())
+        current = self._preview_size[1] if self._preview_size is not None else self.height
+        if height == current:
+            return
+        # while user drags, just stretch last image, rebuild once size settles
+        self._preview_size = (round(self._last_image.width * height / self.height), height)
+        self.show(self._last_image)
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(self.resize_ms, self.apply_resize, height)
+
+    def apply_resize(self, height):
+        self._resize_job = None
+        self._preview_size = None
+        layout = self._layers.pop(height, None)
+        if layout is None:
+            self.set_size(height)
+            self.draw_base()
+            self.draw_ticks()
+            self.build_maps()
+            layout = self._get_layout()
+        else:
+            for attr, value in layout.items():
+                setattr(self, attr, value)
+        self._layers[height] = layout  # most recently used goes last
+        while len(self._layers) > self.resize_cache_size:
+            self._layers.popitem(last=False)
+        self._update_layout()
+        self.label.configure(font=(self.font, self.fontsize, "italic"))
+        # frame doesnt propagate size of children, so follow width of new image and label by hand
+        meter_w = self.base.width + 2 * (int(self.meter["borderwidth"]) + int(self.meter["padx"]))
+        label_w = 0 if self.text_in_image else self.label.winfo_reqwidth() + 5
+        self.configure(width=meter_w + label_w + 2 * int(self["padx"]))
+        self.draw_wedge()
 
     def draw_base(self):
         text_top = f"{self.maxvalue:+}{self.textappend}"
@@ -322,7 +886,7 @@ class PitchMeter(tk.Frame):
         v_offs = self._base_v_offset
         h_offs = self._base_h_offset
         self._base_v_offset = v_offs
-        self.base = Image.new("RGBA", (w+h_offs, h))
+        self.base = Image.new("RGBA", (w + h_offs + self._text_w, h))
         draw = ImageDraw.Draw(self.base)
         # base rectangle
         draw.rectangle(
@@ -331,9 +895,9 @@ class PitchMeter(tk.Frame):
             width=w,
         )
         # labels
-        fontsize_ticks = self.fontsize_ticks
-        draw.text((round((w+h_offs*2) / 2), 0), text=text_top, anchor="mt", font_size=fontsize_ticks, fill=self.wedge_color)
-        draw.text((round((w+h_offs*2) / 2), h), text=text_bot, anchor="mb", font_size=fontsize_ticks, fill=self.wedge_color)
+        atlas = GlyphAtlas.get(None, self.fontsize_ticks)
+        atlas.draw(self.base, (round((w+h_offs*2) / 2), 0), text_top, self.wedge_color, anchor="mt")
+        atlas.draw(self.base, (round((w+h_offs*2) / 2), h), text_bot, self.wedge_color, anchor="mb")
 
     def draw_ticks(self):
         draw = ImageDraw.Draw(self.base)
@@ -341,6 +905,7 @@ class PitchMeter(tk.Frame):
         v_offs = self._base_v_offset
         h_offs = self._base_h_offset
         w = self.width
+        atlas = GlyphAtlas.get(None, self.fontsize_ticks)
         # major ticks
         len_tick = w * 0.6
         x_st = w / 2 - len_tick / 2 + h_offs
@@ -356,7 +921,7 @@ class PitchMeter(tk.Frame):
             )
             # also draw labels for major ticks
             text_tick = f"{pos:+}{self.textappend}"
-            draw.text((h_offs, n_pos), text_tick, anchor="rm", font_size=self.fontsize_ticks, fill=self.wedge_color)
+            atlas.draw(self.base, (h_offs, n_pos), text_tick, self.wedge_color, anchor="rm")
 
         # minor ticks
         len_tick *= 0.4
@@ -371,6 +936,7 @@ class PitchMeter(tk.Frame):
                 end = end - (self.maxvalue - end) / min_tick_step
                 break  # WARN: crutch
             pos_min.extend(np.arange(start, end, min_tick_step))
+        self._tick_values = np.clip(np.sort(np.concatenate((pos_maj, pos_min))), self.minvalue, self.maxvalue)
         for pos in pos_min:
             n_pos = np.interp(pos, (self.minvalue, self.maxvalue), (v_offs, bh - v_offs))
             draw.line(
@@ -380,15 +946,44 @@ class PitchMeter(tk.Frame):
             )
 
     def draw_wedge(self):
-        im = self.base.copy()
+        # tk variables can only be read on this thread, render itself can go to a worker.
+        # first image is rendered here so widget has its size right away
+        val = self.value
+        lut = None
+        if self.history is not None:  # history changes on this thread, so take it here
+            layout = self._layout
+            wsize = self.wedgesize * 0.01 * layout["height"]  # wedgesize is in percent
+            ws_val = wsize * (self.maxvalue - self.minvalue) / (layout["height"] - 2 * layout["_base_v_offset"])
+            # table of a waiting request is free to refill, it gets replaced anyway. otherwise
+            # use the other table, last one may still be read by a render on a worker
+            swap = self.render_pool is not None and not self.render_pool.has_pending(self)
+            lut = self.history.lut(val - ws_val / 2, val + ws_val / 2, swap=swap)
+        if self.render_pool is not None and hasattr(self, "meterimage"):
+            self.render_pool.submit(self, val, self.text, self._layout, lut)
+        else:
+            self.show(self.render(val, self.text, self._layout, lut))
+
+    def show(self, im, val=None, text=None, layout=None, lut=None):
+        # frames rendered for a size we since resized from are dropped
+        if layout is not None and layout["generation"] != self._layout["generation"]:
+            return
+        self._last_image = im
+        if self._preview_size is not None:  # being resized, stretch until it settles
+            im = im.resize(self._preview_size, Image.BILINEAR)
+        self.meterimage = ImageTk.PhotoImage(im)
+        self.meter.configure(image=self.meterimage)
+
+    def render(self, val, text, layout, lut=None):
+        # PIL only, safe to run off the Tk thread. size dependent attributes come from layout
+        # snapshot only, they may be swapped by a resize meanwhile. lut is history overlay alpha per bin
+        im = layout["base"].copy()
         draw = ImageDraw.Draw(im)
         # normalize val based on height and position of base column
-        val = self.value
         inv_val = (self.maxvalue - val) + self.minvalue  # inverting because upside down
-        bh = self.height
-        v_ofs = self._base_v_offset
-        h_ofs = self._base_h_offset
-        w = self.width
+        bh = layout["height"]
+        v_ofs = layout["_base_v_offset"]
+        h_ofs = layout["_base_h_offset"]
+        w = layout["width"]
         wsize = self.wedgesize * 0.01 * bh  # wedgesize is in percent
         normalized_val = np.interp(inv_val, (self.minvalue, self.maxvalue), (v_ofs, bh - v_ofs))
         # draw wedge
@@ -401,13 +996,78 @@ class PitchMeter(tk.Frame):
             (xy_start, xy_end),
             fill=self.wedge_color,
         )
-        # resize and put on label
-        self.meterimage = ImageTk.PhotoImage(im)
-        self.meter.configure(image=self.meterimage)
+        # history under wedge
+        if lut is not None:
+            np.take(lut, layout["_bin_map"], out=layout["_alpha"], mode="clip")
+            overlay = layout["_overlay"]
+            overlay.putalpha(layout["_alpha_image"])  # shares memory with _alpha
+            im.alpha_composite(overlay)
+        # label to the right
+        if self.text_in_image:
+            atlas = GlyphAtlas.get(self.font, layout["fontsize"])
+            atlas.draw(im, (w + h_ofs + 5, bh / 2), text, self.wedge_color, anchor="lm")
+        return im
+
+    def build_maps(self):
+        # per-pixel geometry for interactive mode and history overlay
+        if self.interactive or self.history is not None:
+            self.build_hit_map()
+        if self.history is not None:
+            v_ofs = self._base_v_offset
+            h_ofs = self._base_h_offset
+            rows = np.arange(self.height)[:, None]
+            cols = np.arange(self.base.width)
+            column = (rows >= v_ofs) & (rows <= self.height - v_ofs) & (cols >= h_ofs) & (cols <= h_ofs + self.width)
+            value_map = np.broadcast_to(self._value_map[:, None], column.shape)
+            self._bin_map = self.history.bin_map(value_map, column)
+            self._alpha = np.zeros(self._bin_map.shape, dtype=np.uint8)
+            size = self._alpha.shape[::-1]
+            self._alpha_image = Image.frombuffer("L", size, self._alpha, "raw", "L", 0, 1)
+            self._overlay = Image.new("RGBA", size, self.wedge_color)
+
+    def build_hit_map(self):
+        # value for every row of image, and columns that grab the wedge. done once,
+        # so mouse events are just a lookup
+        v_ofs = self._base_v_offset
+        h_ofs = self._base_h_offset
+        bh = self.height
+        rows = np.arange(bh) + 0.5
+        self._value_map = np.interp(rows, (v_ofs, bh - v_ofs), (self.maxvalue, self.minvalue))
+        self._hit_cols = (h_ofs - self.hit_tolerance, h_ofs + self.width + self.hit_tolerance)
+
+    def on_press(self, e):
+        x, y = event_image_xy(e, self.meter, self.meterimage)
+        self._dragging = self._hit_cols[0] <= x <= self._hit_cols[1] and 0 <= y < self.height
+        self.on_drag(e)
+
+    def on_drag(self, e):
+        # motion events come way faster than we can draw, so only remember the last one
+        # and apply it once per frame
+        if not self._dragging:
+            return
+        self._drag_xy = event_image_xy(e, self.meter, self.meterimage)
+        if self._drag_job is None:
+            self._drag_job = self.after(self.frame_ms, self.apply_drag)
+
+    def on_release(self, e):
+        self._dragging = False
+
+    def apply_drag(self):
+        self._drag_job = None
+        y = min(max(self._drag_xy[1], 0), self.height - 1)
+        value = self._value_map[y]
+        if self.snap_to_ticks:
+            value = self._tick_values[np.abs(self._tick_values - value).argmin()]
+        self.value = float(value)
 
     def var_changed_cb(self, *args):
+        if self.history is not None:
+            self.history.append(self.value)
         if not self._user_supplied_var:
-            self.text = f"{self.value:.1f}{self.textappend}"
+            text = f"{self.value:.1f}{self.textappend}"
+            if text != self._last_text:  # setting textvar makes tk relayout the label, skip if same
+                self._last_text = text
+                self.text = text
         self.draw_wedge()
 
     @property
@@ -431,6 +1091,268 @@ class PitchMeter(tk.Frame):
                 raise ValueError("Value outside min and max")
 
 
+class _GaugeSlot:
+    # one recycled cell of GaugeList: canvas window with a gauge and its name label
+    def __init__(self, cell, gauge, name_label, window):
+        self.cell = cell
+        self.gauge = gauge
+        self.name_label = name_label
+        self.window = window
+        self.index = None
+
+
+class GaugeList(tk.Frame):
+    """Scrollable grid of gauges, one per channel, for lots of channels.
+
+    Only channels in or near the viewport have live widgets. Those are recycled as
+    the view scrolls, and every other channel is just its latest value in an array,
+    so cost depends on the size of the viewport and not on the number of channels.
+    Values dragged on interactive gauges are written back to their channel.
+    """
+
+    overscan = 1  # rows of live gauges to keep above and below viewport
+    wheel_step = 40  # pixels to scroll per mouse wheel notch
+
+    def __init__(
+        self,
+        master,
+        count,
+        gauge_class=None,
+        columns=None,
+        names=None,
+        gauge_kwargs=None,
+        **kwargs,
+    ):
+        self.count = count
+        self.gauge_class = gauge_class or RollMeter
+        self.columns = columns or 1
+        self.names = names  # optional list of channel names shown above gauges
+        self.gauge_kwargs = gauge_kwargs or {}
+        self.rows = math.ceil(self.count / self.columns)
+
+        # super
+        super().__init__(master, **kwargs)
+        self.canvas = tk.Canvas(self, highlightthickness=0)
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self.on_scroll)
+
+        # live gauges
+        self._bound = {}  # channel index -> slot
+        self._free = []
+
+        # first slot tells how big a cell is and what gauge range is
+        slot = self._new_slot()
+        slot.cell.update_idletasks()
+        self.cell_width = slot.cell.winfo_reqwidth()
+        self.cell_height = slot.cell.winfo_reqheight()
+        self._free.append(slot)
+        self.minvalue = slot.gauge.minvalue
+        self.maxvalue = slot.gauge.maxvalue
+        self.values = np.full(self.count, self.minvalue, dtype=float)  # latest value of every channel
+
+        self.canvas.configure(
+            width=self.cell_width * self.columns,
+            height=self.cell_height * min(self.rows, 3),
+            scrollregion=(0, 0, self.cell_width * self.columns, self.cell_height * self.rows),
+            yscrollincrement=1,
+        )
+        self.canvas.bind("<Configure>", self.refresh)
+        self._bind_wheel(self.canvas)
+
+        # pack all
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+    def _new_slot(self):
+        cell = tk.Frame(self.canvas)
+        name_label = tk.Label(cell)
+        if self.names is not None:
+            name_label.pack(side="top")
+        gauge = self.gauge_class(cell, **self.gauge_kwargs)
+        gauge.pack(side="top")
+        window = self.canvas.create_window(0, 0, window=cell, anchor="nw", state="hidden")
+        slot = _GaugeSlot(cell, gauge, name_label, window)
+        gauge.var.trace_add("write", lambda *args: self._pull(slot))
+        self._bind_wheel(cell)
+        return slot
+
+    def _bind_wheel(self, widget):
+        # cells cover the canvas, so wheel has to be bound on them and everything inside too
+        widget.bind("<MouseWheel>", self.on_wheel)
+        widget.bind("<Button-4>", self.on_wheel)
+        widget.bind("<Button-5>", self.on_wheel)
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+    def on_wheel(self, e):
+        up = e.num == 4 or e.delta > 0  # x11 sends buttons 4/5, windows and mac send delta
+        self.canvas.yview_scroll(-self.wheel_step if up else self.wheel_step, "units")
+
+    def _pull(self, slot):
+        # gauge var written by someone else, e.g. dragged in interactive mode
+        if slot.index is not None:
+            self.values[slot.index] = slot.gauge.value
+
+    def _bind_slot(self, slot, index):
+        slot.index = index
+        row, col = divmod(index, self.columns)
+        self.canvas.coords(slot.window, col * self.cell_width, row * self.cell_height)
+        self.canvas.itemconfigure(slot.window, state="normal")
+        if self.names is not None:
+            slot.name_label.configure(text=self.names[index])
+        history = getattr(slot.gauge, "history", None)
+        if history is not None:
+            history.clear()  # it was the previous channel's
+            slot.gauge.var.set(self.values[index])  # always write, so cleared history is redrawn
+        else:
+            self._push(slot, self.values[index])
+        self._bound[index] = slot
+
+    def _push(self, slot, value):
+        if slot.gauge.value != value:  # writing var redraws gauge, even if same
+            slot.gauge.var.set(value)
+
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.refresh()
+
+    def refresh(self, *args):
+        # which channels are in or near viewport
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first_row = max(int(top // self.cell_height) - self.overscan, 0)
+        last_row = min(int(bottom // self.cell_height) + self.overscan, self.rows - 1)
+        first = first_row * self.columns
+        last = min((last_row + 1) * self.columns, self.count)
+        # give back slots that left, then bind free (or new) slots to channels that came in
+        for index in [index for index in self._bound if not first <= index < last]:
+            self._free.append(self._bound.pop(index))
+        for index in range(first, last):
+            if index not in self._bound:
+                self._bind_slot(self._free.pop() if self._free else self._new_slot(), index)
+        for slot in self._free:
+            if slot.index is not None:
+                slot.index = None
+                self.canvas.itemconfigure(slot.window, state="hidden")
+
+    def get(self, index):
+        return self.values[index]
+
+    def set(self, index, value):
+        if not math.isfinite(value):  # nan passes the clamp, keep last value instead
+            return
+        value = min(max(value, self.minvalue), self.maxvalue)
+        self.values[index] = value
+        slot = self._bound.get(index)
+        if slot is not None:
+            self._push(slot, value)
+
+
+class SharedValues:
+    """Channel values shared between processes through multiprocessing.shared_memory.
+
+    Acquisition processes attach by name and write() into their slots. The GUI process
+    binds slots to gauges (or GaugeList channels) and polls every bound slot in one
+    vectorized pass per frame, so there is no per-sample IPC message or copy.
+
+    Each slot has a sequence counter working as a seqlock: the writer makes it odd,
+    writes the value, then makes it even. A reader that sees an odd or changed counter
+    got a torn value, skips it and picks the slot up on the next poll. One writer per slot.
+
+    Only the process that created the shared memory unlinks it. Attaching processes are not
+    registered with the resource tracker, so their exit leaves the block alive for the others.
+    """
+
+    poll_ms = 16
+
+    def __init__(self, slots, name=None, create=None):
+        self.slots = slots
+        create = name is None if create is None else create
+        if not create and sys.version_info >= (3, 13):
+            self.shm = shared_memory.SharedMemory(name=name, size=slots * 16, track=False)
+        else:
+            # before 3.13 attaching registers with the tracker too, which unlinks on exit of
+            # attaching process. dont register at all instead of unregistering after: a child
+            # of creator shares its tracker, and unregister would drop creator's registration
+            register = resource_tracker.register
+            if not create:
+                resource_tracker.register = lambda name, rtype: None
+            try:
+                self.shm = shared_memory.SharedMemory(name=name, create=create, size=slots * 16)
+            finally:
+                resource_tracker.register = register
+        # layout: uint64 seq[slots], then float64 value[slots]. new shared memory is zeroed
+        self.seq = np.ndarray(slots, dtype=np.uint64, buffer=self.shm.buf)
+        self.values = np.ndarray(slots, dtype=np.float64, buffer=self.shm.buf, offset=slots * 8)
+        # reader side
+        self._bound = np.empty(0, dtype=np.intp)  # bound slots
+        self._targets = []  # (target, index) for every bound slot
+        self._seen = np.empty(0, dtype=np.uint64)  # seq of last value pushed to target
+        self.master = None
+        self._poll_job = None
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def write(self, slot, value):
+        seq = self.seq[slot]
+        self.seq[slot] = seq + 1  # odd: write in progress
+        self.values[slot] = value
+        self.seq[slot] = seq + 2
+
+    def write_many(self, slots, values):
+        self.seq[slots] += 1
+        self.values[slots] = values
+        self.seq[slots] += 1
+
+    def bind(self, slot, target, index=None):
+        # target is a gauge, or a GaugeList and index of its channel
+        self._bound = np.append(self._bound, slot)
+        self._targets.append((target, index))
+        self._seen = np.append(self._seen, np.uint64(0))  # seq is never 0 after a write
+
+    def poll(self):
+        slots = self._bound
+        seq = self.seq[slots]
+        values = self.values[slots]
+        seq_after = self.seq[slots]
+        fresh = (seq == seq_after) & (seq % 2 == 0) & (seq != self._seen)
+        self._seen[fresh] = seq[fresh]
+        # nan passes the clamp below, so non-finite values are dropped and gauge keeps last value
+        for i in np.flatnonzero(fresh & np.isfinite(values)):
+            target, index = self._targets[i]
+            value = float(values[i])
+            if index is not None:
+                target.set(index, value)
+            else:
+                target.var.set(min(max(value, target.minvalue), target.maxvalue))
+
+    def start(self, master):
+        # poll on Tk thread of master every poll_ms
+        self.master = master
+        if self._poll_job is None:
+            self._poll_loop()
+
+    def _poll_loop(self):
+        self.poll()
+        self._poll_job = self.master.after(self.poll_ms, self._poll_loop)
+
+    def stop(self):
+        if self._poll_job is not None:
+            self.master.after_cancel(self._poll_job)
+            self._poll_job = None
+
+    def close(self):
+        self.stop()
+        del self.seq, self.values  # views into shm have to go before it can be closed
+        self.shm.close()
+
+    def unlink(self):
+        # call once, from the process that created it
+        self.shm.unlink()
+
+
 if __name__ == "__main__":
     root = tk.Tk()
     mainfr = tk.Frame(root)
@@ -448,11 +1370,11 @@ if __name__ == "__main__":
     RollMeter(gfr, -22, 23, 8, 0, var, 30, True, "Fira Code", None, "\N{DEGREE SIGN}", 250, 10, None, None).pack()
     RollMeter(
         gfr, -100, 100, 20, 2, var, 1, True, "Fira Code", tk.StringVar(value="Noice!"), None, 250, 10, None, None).pack()
-    RollMeter(gfr, -1, 1, 0.1, 1, var, box_length=350, arc_width=50).pack()
+    RollMeter(gfr, -1, 1, 0.1, 1, var, box_length=350, arc_width=50, text_in_image=True, interactive=True, history=200).pack()
 
     # pitchemeter
     pfr = tk.Frame(mainfr)
-    PitchMeter(pfr, height=500, variable=var, textappend="\N{DEGREE SIGN}").pack(side="top")
+    PitchMeter(pfr, height=500, variable=var, textappend="\N{DEGREE SIGN}", interactive=True).pack(side="top")
     PitchMeter(pfr, variable=var, width=100, textappend="\N{DEGREE SIGN}", major_ticks_step=3, minor_ticks_per_major=3).pack(
         side="top", anchor="w"
     )
@@ -2,6 +2,7 @@ import math
 from tkinter import IntVar, StringVar, ttk
 from tkinter.ttk import Frame
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageTk
 from ttkbootstrap import Colors, Style
 
@@ -19,6 +20,15 @@ class Meter(Frame):
     By default, the ``stripethickness`` is 0, which results in a solid progressbar. A higher ``stripethickness`` results
     in larger widgets around the meter.
 
+    With ``anglemap=True`` the meter precomputes the angle of every pixel and a fully filled progressbar once, and each
+    update only thresholds that map at output resolution. Update cost then no longer depends on the value or on the
+    number of stripes.
+
+    In interactive mode mouse motion is coalesced: only the latest pointer position is kept, and the value is updated at
+    most once per ``dialinterval`` milliseconds, so a drag costs one redraw per frame instead of one per motion event.
+    With ``anglemap=True`` the dial is hit-tested through the precomputed angle map, and only a press on the arc
+    grabs it. ``snapstep`` rounds the dialed value to a multiple of the step.
+
     Various text and label options exist. You can prepend or append text to the central text displayed on the widget
     with the ``textappend`` and ``textprepend`` parameters.  You can also change the style and font size of those
     elements.
@@ -38,6 +48,7 @@ class Meter(Frame):
         arcoffset=None,
         amounttotal=100,
         amountused=0,
+        anglemap=False,
         interactive=False,
         labelfont="Helvetica 10 bold",
         labelstyle="secondary.TLabel",
@@ -47,6 +58,7 @@ class Meter(Frame):
         metertype="full",
         meterthickness=10,
         showvalue=True,
+        snapstep=None,
         stripethickness=0,
         textappend=None,
         textfont="Helvetica 25 bold",
@@ -63,6 +75,7 @@ class Meter(Frame):
             arcrange (int): the range of the arc in degrees from starting to ending position.
             amounttotal (int): the maximum value of the meter.
             amountused (int): the current value of the meter; display on the meter if ``showvalue`` is ``True``.
+            anglemap (bool): render updates from a precomputed per-pixel angle map instead of redrawing the arc.
             interactive (bool): allows the meter to be adjusted with clicks and drags.
             labelfont(int): the font size of the supplemental label.
             labelstyle (str): the ttk style used to render the supplemental label.
@@ -72,6 +85,7 @@ class Meter(Frame):
             metertype (str): `full`, or `semi`; displays a full-circle or semi-circle.
             meterthickness (int): the thickness of the meter's progress bar.
             showvalue (bool): shows the meter value in the central text of the meter; default = True.
+            snapstep (int): in interactive mode, round the dialed value to a multiple of this step.
             stripethickness (int): shows the meter's progressbar in solid or striped form. If the value is greater than
                 0, the meter's progressbar changes from a solid to a stripe, where the value is the thickness of the
                 stripes.
@@ -106,10 +120,18 @@ class Meter(Frame):
         self.stripethickness = stripethickness
         self.showvalue = showvalue
         self.wedgesize = wedgesize
+        self.anglemap = anglemap
+        self.snapstep = snapstep
+        self.dialinterval = 16
+        self.dialactive = False
+        self.dialposition = None
+        self.dialafterid = None
 
         # meter image
         self.meter = ttk.Label(self.box)
         self.draw_base_image()
+        if anglemap:
+            self.draw_angle_map()
         self.draw_meter()
 
         # text & Label widgets
@@ -124,7 +146,7 @@ class Meter(Frame):
         # set interactive mode
         if interactive:
             self.meter.bind("<B1-Motion>", self.on_dial_interact)
-            self.meter.bind("<Button-1>", self.on_dial_interact)
+            self.meter.bind("<Button-1>", self.on_dial_press)
 
         # geometry manager
         self.meter.place(x=0, y=0)
@@ -190,15 +212,82 @@ class Meter(Frame):
         Args:
             *args: if triggered by a trace, will be `variable`, `index`, `mode`.
         """
-        im = self.base_image.copy()
-        draw = ImageDraw.Draw(im)
-        if self.stripethickness > 0:
-            self.draw_striped_meter(draw)
+        if self.anglemap:
+            im = self.draw_angle_map_meter()
         else:
-            self.draw_solid_meter(draw)
-        self.meterimage = ImageTk.PhotoImage(im.resize((self.metersize, self.metersize), Image.BICUBIC))
+            im = self.base_image.copy()
+            draw = ImageDraw.Draw(im)
+            if self.stripethickness > 0:
+                self.draw_striped_meter(draw)
+            else:
+                self.draw_solid_meter(draw)
+            im = im.resize((self.metersize, self.metersize), Image.BICUBIC)
+        self.meterimage = ImageTk.PhotoImage(im)
         self.meter.configure(image=self.meterimage)
 
+    def draw_angle_map(self):
+        """Precompute the angle map, and the meter when empty and when full, used when ``anglemap=True``
+
+        Any frame is then a per-pixel blend between those two images, so it looks the same as the normal rendering.
+        """
+        size = self.metersize
+        self.base_image_small = self.base_image.resize((size, size), Image.BICUBIC)
+
+        # the meter as it looks at ``amounttotal``; a wedge is always solid and may stick out past either end by
+        # ``wedgesize``
+        full_image = self.base_image.copy()
+        draw = ImageDraw.Draw(full_image)
+        if self.stripethickness > 0 and self.wedgesize <= 0:
+            for x in range(self.arcoffset, self.arcrange + self.arcoffset - 1, self.stripethickness):
+                draw.arc(
+                    (0, 0, size * 5 - 20, size * 5 - 20),
+                    x,
+                    x + self.stripethickness - 1,
+                    self.meterforeground,
+                    self.meterthickness * 5,
+                )
+        else:
+            wedgesize = max(self.wedgesize, 0)
+            draw.arc(
+                (0, 0, size * 5 - 20, size * 5 - 20),
+                self.arcoffset - wedgesize,
+                self.arcrange + self.arcoffset + wedgesize,
+                self.meterforeground,
+                self.meterthickness * 5,
+            )
+        self.full_image_small = full_image.resize((size, size), Image.BICUBIC)
+        self.base_array = np.asarray(self.base_image_small, dtype=np.float32)
+        self.full_difference = np.asarray(self.full_image_small, dtype=np.float32) - self.base_array
+
+        # angle of each pixel center in degrees clockwise from ``arcoffset`` (same as pillow), and the length of one
+        # degree of arc in pixels at that pixel, used to antialias the cut
+        center = (size * 5 - 20) / 10
+        y, x = np.mgrid[:size, :size] + 0.5 - center
+        self.angle_map = ((np.degrees(np.arctan2(y, x)) - self.arcoffset) % 360).astype(np.float32)
+        self.degree_length_map = (np.hypot(x, y) * math.pi / 180).astype(np.float32)
+
+        # pixels that grab the dial: the arc, with a few pixels of slack on every side
+        radius = np.hypot(x, y)
+        slack = 5 / np.maximum(self.degree_length_map, 1e-6)  # 5 pixels in degrees at that radius
+        on_arc = (self.angle_map <= self.arcrange + slack) | (self.angle_map >= 360 - slack)
+        self.hit_map = on_arc & (radius <= center + 5) & (radius >= center - self.meterthickness - 5)
+
+    def draw_angle_map_meter(self):
+        """Blend from the empty to the full meter up to the current value
+
+        Returns:
+            Image: the meter image at output resolution.
+        """
+        meter_value = self.meter_value() - self.arcoffset
+        if self.wedgesize > 0:
+            distance = np.abs((self.angle_map - meter_value + 180) % 360 - 180)
+            coverage = (self.wedgesize - distance) * self.degree_length_map
+        else:
+            coverage = (meter_value - self.angle_map) * self.degree_length_map
+        np.clip(coverage, 0, 1, out=coverage)
+        meter_array = self.base_array + self.full_difference * coverage[..., None]
+        return Image.fromarray(np.rint(meter_array).astype(np.uint8))
+
     def draw_solid_meter(self, draw):
         """Draw a solid meter
 
@@ -268,24 +357,55 @@ class Meter(Frame):
         """
         return int((self.amountused / self.amounttotal) * self.arcrange + self.arcoffset)
 
+    def on_dial_press(self, e):
+        """Callback for mouse click on indicator
+
+        Args:
+            e (Event): event callback for the click.
+        """
+        if self.anglemap:
+            x = min(max(e.x, 0), self.metersize - 1)
+            y = min(max(e.y, 0), self.metersize - 1)
+            self.dialactive = bool(self.hit_map[y, x])
+        else:
+            self.dialactive = True
+        self.on_dial_interact(e)
+
     def on_dial_interact(self, e):
         """Callback for mouse drag motion on indicator
 
+        Only the latest position is kept; the value is updated by ``update_dial`` once per ``dialinterval``.
+
         Args:
             e (Event): event callback for drag motion.
         """
-        dx = e.x - self.metersize // 2
-        dy = e.y - self.metersize // 2
-        rads = math.atan2(dy, dx)
-        degs = math.degrees(rads)
-
-        if degs > self.arcoffset:
-            factor = degs - self.arcoffset
+        if not self.dialactive:
+            return
+        self.dialposition = (e.x, e.y)
+        if self.dialafterid is None:
+            self.dialafterid = self.after(self.dialinterval, self.update_dial)
+
+    def update_dial(self):
+        """Set the value from the latest pointer position"""
+        self.dialafterid = None
+        x, y = self.dialposition
+        if self.anglemap:
+            factor = self.angle_map[min(max(y, 0), self.metersize - 1), min(max(x, 0), self.metersize - 1)]
         else:
-            factor = 360 + degs - self.arcoffset
+            dx = x - self.metersize // 2
+            dy = y - self.metersize // 2
+            rads = math.atan2(dy, dx)
+            degs = math.degrees(rads)
+
+            if degs > self.arcoffset:
+                factor = degs - self.arcoffset
+            else:
+                factor = 360 + degs - self.arcoffset
 
         # clamp value between 0 and ``amounttotal``
         amountused = int(self.amounttotal / self.arcrange * factor)
+        if self.snapstep:
+            amountused = round(amountused / self.snapstep) * self.snapstep
         if amountused < 0:
             self.amountused = 0
         elif amountused > self.amounttotal:
@@ -337,6 +457,7 @@ if __name__ == "__main__":
         meterstyle="info.TLabel",
         stripethickness=10,
         interactive=True,
+        snapstep=100,
     ).grid(row=0, column=1)
     Meter(
         metersize=180,
@@ -347,6 +468,7 @@ if __name__ == "__main__":
         textappend="%",
         meterstyle="success.TLabel",
         interactive=True,
+        anglemap=True,
     ).grid(row=1, column=0)
     Meter(
         metersize=180,